@@ -18,6 +18,7 @@ Usage:
     client = JIRA(auth=creds.auth)
 
 """
+import functools
 import getpass
 import os
 from typing import Optional
@@ -27,6 +28,13 @@ from enums import (
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _current_user() -> str:
+    # getpass.getuser() ends up in getpwuid()/NSS; the answer never changes
+    # within a process, so look it up once.
+    return getpass.getuser()
+
+
 class Credentials:
     """
     An object concealing the contents of loaded credentials. The object is
@@ -34,14 +42,17 @@ class Credentials:
     "guts" when dumped into a stacktrace. Note this is for SAFETY, not
     security.
     """
+    # Slot names get the same class-body name mangling as the attribute
+    # assignments below, so '__auth' lines up with self.__auth.
+    __slots__ = ('__auth', '_alias')
+
     def __init__(self, username: str, password: str, alias: str):
         # The double underscores are intentional
-        self.__username = username
-        self.__password = password
+        self.__auth = (username, password)
         self._alias = alias
 
     def auth(self) -> (str, str):
-        return self.__username, self.__password
+        return self.__auth
 
     def alias(self) -> str:
         return self._alias
@@ -62,15 +73,36 @@ class CredentialsProvider:
 
     def __init__(self, jira_environment: JiraEnvironment):
         self._env = jira_environment
-        self._user = getpass.getuser()
+        self._user = _current_user()
+        self._dev_user_path = self.DEV_USER_PATH.format(self._user)
+        self._dev_pass_path = self.DEV_PASSWD_PATH.format(self._user)
+        self._cached_creds: Optional[Credentials] = None
 
     def load_credentials(self) -> Optional[Credentials]:
         """
         Returns the Credentials object given the provider's JiraEnvironment
         configuration.
 
+        The result is memoized on the provider, so repeat calls do not re-read
+        credential files from disk. Call refresh() to force a re-load (e.g.
+        after credential rotation).
+
         If no credentials can be found, returns None.
         """
+        if self._cached_creds is not None:
+            return self._cached_creds
+
+        self._cached_creds = self._find_credentials()
+        return self._cached_creds
+
+    def refresh(self) -> Optional[Credentials]:
+        """
+        Drops the memoized credentials and re-loads them from their source.
+        """
+        self._cached_creds = None
+        return self.load_credentials()
+
+    def _find_credentials(self) -> Optional[Credentials]:
         if self._env == JiraEnvironment.Prod:
             return self._load_production()
 
@@ -84,7 +116,7 @@ class CredentialsProvider:
         if creds:
             return creds
 
-        creds = self._load_dev(self._user)
+        creds = self._load_dev()
         if creds:
             return creds
 
@@ -110,52 +142,65 @@ class CredentialsProvider:
             'Production',
         )
 
-    @classmethod
-    def _load_dev(cls, user: str) -> Optional[Credentials]:
-        # Load from files in user's home directory.
-        user_file = cls.DEV_USER_PATH.format(user)
-        if not os.path.exists(user_file):
+    def _load_dev(self) -> Optional[Credentials]:
+        # Load from files in user's home directory. Open the files directly
+        # rather than stat-ing them first--a missing file is just a miss.
+        username = self._try_read(self._dev_user_path)
+        if username is None:
             return None
-        pass_file = cls.DEV_PASSWD_PATH.format(user)
-        if not os.path.exists(pass_file):
+        password = self._try_read(self._dev_pass_path)
+        if password is None:
             return None
 
-        return cls._load_from_files(
-            user_file,
-            pass_file,
-            f'OneFlow, {user}',
+        return Credentials(
+            username,
+            password,
+            f'OneFlow, {self._user}',
         )
 
     @classmethod
     def _load_env(cls) -> Optional[Credentials]:
         # Load directly from these environment vars; they're raw creds, not
-        # filepaths.
-        if not os.environ.get('ENV_JIRA_USER'):
-            return None
-        if not os.environ.get('ENV_JIRA_PASS'):
+        # filepaths. Look each var up once--os.environ.get re-decodes on
+        # every call.
+        env = os.environ
+        user = env.get('ENV_JIRA_USER')
+        password = env.get('ENV_JIRA_PASS')
+        if not user or not password:
             return None
 
-        return Credentials(
-            os.environ.get('ENV_JIRA_USER'),
-            os.environ.get('ENV_JIRA_PASS'),
-            'Local Env Vars'
-        )
+        return Credentials(user, password, 'Local Env Vars')
 
     @classmethod
     def _load_local_dev(cls) -> Optional[Credentials]:
         # Load from files on the local filesystem, specified in ENV vars.
-        if not os.environ.get('LOCAL_JIRA_USER'):
-            return None
-        if not os.environ.get('LOCAL_JIRA_PASS'):
+        env = os.environ
+        user_path = env.get('LOCAL_JIRA_USER')
+        pass_path = env.get('LOCAL_JIRA_PASS')
+        if not user_path or not pass_path:
             return None
 
         return cls._load_from_files(
-            os.environ.get('LOCAL_JIRA_USER'),
-            os.environ.get('LOCAL_JIRA_PASS'),
+            user_path,
+            pass_path,
             'Local Cred Files',
         )
 
     @staticmethod
     def _read_file(path) -> str:
-        with open(path, 'r', encoding='utf-8') as file:
-            return file.read().strip()
+        # Credential files are a single short line; a raw read skips the
+        # TextIOWrapper/BufferedReader stack that open() would set up.
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+
+        return data.decode('utf-8').strip()
+
+    @classmethod
+    def _try_read(cls, path) -> Optional[str]:
+        try:
+            return cls._read_file(path)
+        except FileNotFoundError:
+            return None
@@ -1,4 +1,5 @@
 import logging
+import re
 from typing import Dict, Union
 
 # pylint: disable=import-error
@@ -12,24 +13,55 @@ LOGGER = logging.getLogger(__name__)
 
 class DomainAligner:
 
+    __slots__ = (
+        '_mappings',
+        '_base_pattern',
+        '_aligned_pattern',
+        '_replacements',
+        '_aligned_prefixes',
+        '_debug_enabled',
+    )
+
     # Maps the hostname of "incorrect" domains to the "correct" domains.
     # Make sure the values do not have protocols or paths.
     # These mappings are applied as direct string replacements.
     DEFAULT_MAPPINGS = {
         'jira-dev.example.com': (
-            JiraEnvironment.Dev.value.replace('https://', '')
+            JiraEnvironment.Dev.value.replace('https://', '', 1)
         ),
         'jira-stage.example.com': (
-            JiraEnvironment.Staging.value.replace('https://', '')
+            JiraEnvironment.Staging.value.replace('https://', '', 1)
         ),
         'jira.example.com': (
-            JiraEnvironment.Prod.value.replace('https://', '')
+            JiraEnvironment.Prod.value.replace('https://', '', 1)
         ),
     }
 
     def __init__(self, mappings: Dict[str, str] = None):
         self._mappings = mappings or self.DEFAULT_MAPPINGS
 
+        # Precompile one alternation pattern per direction so realignment is
+        # a single linear scan of the URI, regardless of how many mappings
+        # are configured.
+        self._base_pattern = re.compile(
+            '|'.join(re.escape(base) for base in self._mappings)
+        )
+        self._aligned_pattern = re.compile(
+            '|'.join(re.escape(aligned) for aligned in self._mappings.values())
+        )
+        self._replacements = dict(self._mappings)
+
+        # Common case first: resources that already point at the correct
+        # domain (e.g. everything in Prod) start with one of these prefixes.
+        # str.startswith with a tuple runs in C and short-circuits.
+        self._aligned_prefixes = tuple(
+            f'https://{aligned}' for aligned in self._mappings.values()
+        ) + tuple(self._mappings.values())
+
+        # Snapshot the debug flag so the per-issue hot path doesn't pay for
+        # Logger.debug's level check (realign runs once per yielded issue).
+        self._debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+
     def realign_api_domain(self, resource: Union[Resource, dict]):
         """
         Monkeypatch jira issues to point to the correct domain
@@ -62,11 +94,27 @@ class DomainAligner:
                 f"type {type(resource)}: {resource}"
             )
 
-        if self._is_aligned(resource_uri):
-            LOGGER.debug('Resource with uri %s already aligned', resource_uri)
+        if resource_uri.startswith(self._aligned_prefixes):
             return resource
 
-        proper_uri = self._get_aligned_uri(resource_uri)
+        if self._aligned_pattern.search(resource_uri):
+            if self._debug_enabled:
+                LOGGER.debug(
+                    'Resource with uri %s already aligned', resource_uri
+                )
+            return resource
+
+        proper_uri, replaced = self._base_pattern.subn(
+            lambda match: self._replacements[match.group(0)],
+            resource_uri,
+            count=1,
+        )
+        if not replaced:
+            LOGGER.warning(
+                'JIRA Resource Alignment Failed: %s has no valid uri mapping',
+                resource_uri,
+            )
+            return resource
 
         if is_obj:
             resource.self = proper_uri
@@ -74,22 +122,3 @@ class DomainAligner:
             resource['self'] = proper_uri
 
         return resource
-
-    def _is_aligned(self, resource_uri: str) -> bool:
-        return any(
-            mapped_value in resource_uri
-            for mapped_value
-            in self._mappings.values()
-        )
-
-    def _get_aligned_uri(self, resource_uri: str):
-        for base_uri, aligned_uri in self._mappings.items():
-            if base_uri in resource_uri:
-                return resource_uri.replace(base_uri, aligned_uri)
-
-        LOGGER.warning(
-            'JIRA Resource Alignment Failed: %s has no valid uri mapping',
-            resource_uri,
-        )
-
-        return resource_uri
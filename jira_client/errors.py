@@ -5,16 +5,24 @@ from jira.exceptions import JIRAError
 # pylint: enable=import-error
 
 
-COMPONENT_ERROR = re.compile("Component name \'(.*)\' is not valid")
-NONEXISTENT_USER_ERROR = re.compile("User \'(.*)\' does not exist")
+COMPONENT_ERROR = re.compile(r"Component name '(.*)' is not valid")
+NONEXISTENT_USER_ERROR = re.compile(r"User '(.*)' does not exist")
+
+# Precompiled so each predicate costs a single scan of the error body
+# instead of multiple substring probes.
+ISSUE_NOT_FOUND_ERROR = re.compile(
+    r'An issue with key .* does not exist',
+    re.DOTALL,
+)
+ISSUE_DOES_NOT_EXIST_ERROR = re.compile('Issue Does Not Exist')
 
 
 def is_issue_not_found_error(err: JIRAError) -> bool:
-    return 'An issue with key' in err.text and 'does not exist' in err.text
+    return ISSUE_NOT_FOUND_ERROR.search(err.text) is not None
 
 
 def is_issue_does_not_exist_error(err: JIRAError) -> bool:
-    return 'Issue Does Not Exist' in err.text
+    return ISSUE_DOES_NOT_EXIST_ERROR.search(err.text) is not None
 
 
 def is_create_issue_component_error(err: JIRAError) -> bool:
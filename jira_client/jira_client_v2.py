@@ -15,6 +15,8 @@ Usage:
 
 """
 import logging
+import threading
+
 from jira import JIRA
 
 from enums import (
@@ -41,9 +43,23 @@ class JiraClient:
     def __init__(self,
                  jira_environment: JiraEnvironment,
                  local_execution=False,
-                 credential_provider=None):
+                 credential_provider=None,
+                 eager=False,
+                 http_adapter=None):
+        """
+        By default the JIRA connection is established lazily on first use of
+        .client. Pass eager=True (or call prewarm()) to pay the handshake
+        cost up front instead of on the first API call--useful when cold
+        start happens before the latency-sensitive path.
+
+        http_adapter optionally takes a requests HTTPAdapter to mount on
+        the underlying HTTP session. Sharing one tuned adapter (pool size,
+        retries) across clients shares its connection pool, so they reuse
+        kept-alive connections instead of re-handshaking TLS.
+        """
         self._jira_environment = jira_environment
         self._local_execution = local_execution
+        self._http_adapter = http_adapter
 
         # Allow to use other credentials other than VM team's
         self._credentials_provider = (
@@ -51,18 +67,43 @@ class JiraClient:
             if credential_provider else CredentialsProvider(jira_environment)
         )
         self._client = None
+        self._client_lock = threading.Lock()
+
+        if eager:
+            self.connect()
 
     def connect(self) -> JIRA:
         """
         Initializes a new connection to the JIRA server and returns a JIRA
         object associated with it.
         """
-        self._client = JIRA(
+        # Fully configure the client before publishing it: the .client fast
+        # path reads self._client without the lock, so assigning it must be
+        # the last step--otherwise a concurrent caller can see the session
+        # while the adapter is still being mounted.
+        client = JIRA(
             self._jira_environment.value,
             auth=self._client_auth,
             proxies=self._client_proxies,
         )
-        return self._client
+        if self._http_adapter is not None:
+            # pylint: disable=protected-access
+            session = client._session
+            session.mount('https://', self._http_adapter)
+            session.mount('http://', self._http_adapter)
+            # pylint: enable=protected-access
+        self._client = client
+        return client
+
+    def prewarm(self) -> None:
+        """
+        Establishes the JIRA connection now if one doesn't exist yet, so the
+        first API call doesn't pay for the handshake.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self.connect()
 
     @property
     def environment(self) -> JiraEnvironment:
@@ -98,7 +139,15 @@ class JiraClient:
         """
         Fetches the JIRA client. If none currently exists, one will be newly
         created, otherwise it will re-use any existing client.
+
+        First access is guarded by a lock (double-checked) so concurrent
+        callers don't each pay for their own JIRA handshake.
         """
-        if not self._client:
-            self.connect()
-        return self._client
+        client = self._client
+        if client is not None:
+            return client
+
+        with self._client_lock:
+            if self._client is None:
+                self.connect()
+            return self._client
@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 from typing import Dict, Optional
 
 from jira import User
@@ -33,49 +34,95 @@ class JiraUsersAPI:
             user_email,
             maxResults=1,
         )
-        if len(results) > 0:
+        if results:
             return results[0]
 
         return None
 
 
 class JiraUsersCache:
-    CACHE = {}
+    # The global cache is shared by every instance in the process; bound it
+    # so long-running workers don't accumulate users forever. Entries are
+    # evicted least-recently-used once MAX_CACHE_SIZE is exceeded.
+    MAX_CACHE_SIZE = 4096
+
+    CACHE: 'OrderedDict[str, Optional[User]]' = OrderedDict()
+    # Secondary index mapping the user key to the email the user is cached
+    # under, so key lookups are a dict hit instead of a scan of every cached
+    # user.
+    CACHE_BY_KEY = {}
+    # Keys the API already told us do not exist. Without this, every repeat
+    # lookup of a nonexistent user re-hits the JIRA API. Kept as a bounded
+    # LRU (OrderedDict used as a set) so a user created after a failed
+    # lookup eventually becomes visible again and long-running workers
+    # don't grow the set forever; see also invalidate_missing_key().
+    MAX_MISSING_KEYS = 1024
+    MISSING_KEYS: 'OrderedDict[str, None]' = OrderedDict()
 
     def __init__(self, users_api: JiraUsersAPI, global_cache=True):
         self._users_api = users_api
 
         # FYI: The caches are keyed by the email, not by the key.
-        self._cache: Dict[str, Optional[User]] = {}
+        self._cache: 'OrderedDict[str, Optional[User]]' = OrderedDict()
+        self._cache_by_key: Dict[str, str] = {}
+        self._missing_keys: 'OrderedDict[str, None]' = OrderedDict()
         self._global_cache = global_cache
 
+    def _caches(self):
+        """
+        Returns the (users, by_key, missing_keys) cache trio this instance
+        reads and writes--either the process-global ones or this instance's
+        own, depending on global_cache.
+        """
+        if self._global_cache:
+            return self.CACHE, self.CACHE_BY_KEY, self.MISSING_KEYS
+
+        return self._cache, self._cache_by_key, self._missing_keys
+
+    @classmethod
+    def _store(cls, cache, cache_by_key, email, user):
+        cache[email] = user
+        cache.move_to_end(email)
+        while len(cache) > cls.MAX_CACHE_SIZE:
+            evicted_email, evicted_user = cache.popitem(last=False)
+            if evicted_user:
+                cache_by_key.pop(evicted_user.key, None)
+
     def get_user_by_key(self, key: str) -> Optional[User]:
         if not key:
             return None
 
-        if self._global_cache:
-            for user in self.CACHE.values():
-                if user and user.key == key:
-                    return user
-
-            user = self._users_api.get_user_by_key(key)
-            if user:
-                assert isinstance(user, User)
-                self.CACHE[user.emailAddress] = user
-
-            return user
+        cache, cache_by_key, missing_keys = self._caches()
+        if key in missing_keys:
+            missing_keys.move_to_end(key)
+            return None
 
-        for user in self._cache.values():
-            if user and user.key == key:
-                return user
+        email = cache_by_key.get(key)
+        if email is not None:
+            cache.move_to_end(email)
+            return cache[email]
 
         user = self._users_api.get_user_by_key(key)
         if user:
             assert isinstance(user, User)
-            self._cache[user.emailAddress] = user
+            self._store(cache, cache_by_key, user.emailAddress, user)
+            cache_by_key[user.key] = user.emailAddress
+        else:
+            missing_keys[key] = None
+            while len(missing_keys) > self.MAX_MISSING_KEYS:
+                missing_keys.popitem(last=False)
 
         return user
 
+    def invalidate_missing_key(self, key: str) -> None:
+        """
+        Drops the negative-cache entry for the given key, so the next
+        get_user_by_key(key) re-queries the API. Call this after creating a
+        user whose lookup previously came back empty.
+        """
+        _, _, missing_keys = self._caches()
+        missing_keys.pop(key, None)
+
     def get_user_by_email(self, user_email: str) -> Optional[User]:
         """
         Queries the JIRA API with the given Airbnb email address for a matching
@@ -85,17 +132,13 @@ class JiraUsersCache:
         if not user_email:
             return None
 
-        if self._global_cache:
-            if user_email not in self.CACHE:
-                self.CACHE[user_email] = self._users_api.get_user_by_email(
-                    user_email
-                )
-
-            return self.CACHE[user_email]
-
-        if user_email not in self._cache:
-            self._cache[user_email] = self._users_api.get_user_by_email(
-                user_email
-            )
+        cache, cache_by_key, _ = self._caches()
+        if user_email not in cache:
+            user = self._users_api.get_user_by_email(user_email)
+            self._store(cache, cache_by_key, user_email, user)
+            if user:
+                cache_by_key[user.key] = user_email
+        else:
+            cache.move_to_end(user_email)
 
-        return self._cache[user_email]
+        return cache[user_email]
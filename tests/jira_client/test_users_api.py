@@ -1,25 +1,12 @@
 import pytest
 
-from jira_client.enums import (
-    JiraEnvironment,
-)
-from jira_client.jira_client_v2 import (
-    JiraClient,
-)
-from jira_client.users_api import \
-    JiraUsersAPI
-
-
-@pytest.fixture(name='true_jira_client')
-def _true_jira_client():
-    return JiraClient(
-        JiraEnvironment.Dev,
-        local_execution=True,
-    )
-
 
 @pytest.fixture(name='true_jira_users_api')
 def _jira_users_api(true_jira_client):
+    # Deferred so unit-only runs don't import the jira package at
+    # collection time.
+    from jira_client.users_api import JiraUsersAPI
+
     return JiraUsersAPI(true_jira_client)
 
 
@@ -2,29 +2,66 @@
 A collection of test utilities for retrieving unittest data
 """
 import csv
+import functools
+import mmap
 import os
+from types import SimpleNamespace
 
 
-class dotdict(dict):  # pylint: disable=invalid-name
-    """dot.notation access to dictionary attributes"""
-    __getattr__ = dict.get
-    __setattr__ = dict.__setitem__
-    __delattr__ = dict.__delitem__
+class dotdict(SimpleNamespace):  # pylint: disable=invalid-name
+    """
+    dot.notation access to dictionary attributes.
+
+    SimpleNamespace gives C-level attribute access; the old dict subclass
+    routed every access through an overridden __getattr__ (and silently
+    returned None for missing keys, masking typos).
+    """
+    def __init__(self, attributes: dict):
+        super().__init__(**attributes)
+
 
+VMBASEPATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../")
+)
 
+
+@functools.lru_cache(maxsize=None)
 def get_test_data_filename(shortname):
     """
     Returns the fully qualified filepath of the requested test data file.
+
+    The resolved path is memoized and no longer stat-ed here; a missing
+    file surfaces as FileNotFoundError (naming the full path) from
+    whatever opens it, instead of costing every caller an extra stat.
     """
-    vmbasepath = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "../../")
-    )
-    filename = f"{vmbasepath}/tests/data/{shortname}"
+    return f"{VMBASEPATH}/tests/data/{shortname}"
 
-    if not os.path.exists(filename):
-        raise FileNotFoundError(f"no such test file: {shortname}")
 
-    return filename
+@functools.lru_cache(maxsize=None)
+def _parse_rows(filename, delimiter, as_dict, _mtime_ns):
+    """
+    Parses and materializes a delimited file once per (file, mtime); repeat
+    callers iterate the cached rows instead of re-opening and re-parsing the
+    same data. The mtime key makes an edited file re-parse.
+    """
+    # DictReader does the header-to-value mapping in C; newline='' is the
+    # documented csv fast path (no double newline translation).
+    with open(filename, encoding='utf-8', newline='') as fd:
+        if as_dict:
+            return tuple(csv.DictReader(fd, delimiter=delimiter))
+
+        reader = csv.reader(fd, delimiter=delimiter)
+        next(reader, None)  # skip the header row
+        return tuple(reader)
+
+
+def _cached_rows(filename, delimiter, as_dict):
+    return _parse_rows(
+        filename,
+        delimiter,
+        as_dict,
+        os.stat(filename).st_mtime_ns,
+    )
 
 
 def get_test_data(name):
@@ -32,10 +69,14 @@ def get_test_data(name):
     Given a short filename from tests/data/[FILENAME], will open the file
     and return all of its contents.
     """
-    with open(get_test_data_filename(name), 'r', encoding='utf-8') as f:
-        data = f.read().strip()
-
-    return data
+    # mmap lets the OS page cache serve repeat reads of the same file with
+    # no further read syscalls.
+    with open(get_test_data_filename(name), 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses zero-length files
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode('utf-8').strip()
 
 
 def get_test_data_tsv(name, abspath=None):
@@ -46,19 +87,9 @@ def get_test_data_tsv(name, abspath=None):
     The given tsv file MUST have a header row.
     """
     filename = abspath or get_test_data_filename(name)
-    with open(filename, encoding='utf-8') as fd:
-        tsv_reader = csv.reader(fd, delimiter="\t")
-        headers = None
-        for line in tsv_reader:
-            if headers is None:
-                headers = line
-                continue
-
-            row = {}
-            for idx, header in enumerate(headers):
-                row[header] = line[idx]
-
-            yield row
+    # Copy each row so a caller mutating one can't corrupt the cache.
+    for row in _cached_rows(filename, "\t", as_dict=True):
+        yield dict(row)
 
 def get_test_rows_tsv(name, abspath=None):
     """
@@ -68,15 +99,8 @@ def get_test_rows_tsv(name, abspath=None):
     dictionary.
     """
     filename = abspath or get_test_data_filename(name)
-    with open(filename, encoding='utf-8') as fd:
-        tsv_reader = csv.reader(fd, delimiter="\t")
-        headers = None
-        for line in tsv_reader:
-            if headers is None:
-                headers = line
-                continue
-
-            yield line
+    for row in _cached_rows(filename, "\t", as_dict=False):
+        yield list(row)
 
 def get_test_data_csv(name):
     """
@@ -85,16 +109,6 @@ def get_test_data_csv(name):
 
     The given csv file MUST have a header row.
     """
-    with open(get_test_data_filename(name), encoding='utf-8') as fd:
-        csv_reader = csv.reader(fd)
-        headers = None
-        for line in csv_reader:
-            if headers is None:
-                headers = line
-                continue
-
-            row = {}
-            for idx, header in enumerate(headers):
-                row[header] = line[idx]
-
-            yield row
+    filename = get_test_data_filename(name)
+    for row in _cached_rows(filename, ",", as_dict=True):
+        yield dict(row)